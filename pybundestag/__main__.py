@@ -1,6 +1,41 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+# Import Modules
+import pybundestag.parser.speechparser
+import os
+import sys
+
+
+# Parse Single Protocol and tag its Data Quality Issues with the File
+def _parse_protocol_file(file, args, output = "list", metadata = None, skip = True):
+    """Returns the speeches and issues of a protocol
+
+    If skip is True, files that can not be parsed are
+    reported on stderr and None is returned instead of
+    the speeches. Otherwise, the error is raised.
+    """
+    issues = []
+    try:
+        protocol = pybundestag.parser.speechparser.read_protocol(file)
+        speeches = pybundestag.parser.speechparser.collect_speeches(protocol,
+                                                        output = output,
+                                                        metadata = args.meta if metadata is None else metadata,
+                                                        normalize = args.normalize,
+                                                        report = issues,
+                                                        strict = args.strict)
+    except Exception as e:
+        if not skip:
+            raise
+        print("\nSkipping File {}: {}".format(file, e), file = sys.stderr)
+        return(None, [])
+    return(speeches, _tag_issues(issues, file))
+
+# Record Data Quality Issues with the File they were found in
+def _tag_issues(issues, file):
+    return([{**x, "File" : os.path.basename(file)} for x in issues])
+
+
 def main():
 
     
@@ -9,26 +44,45 @@ def main():
         # Import Modules
     import pybundestag.parser.speechparser
     import pybundestag.parser.mdbparser
+    import pybundestag.parser.checkpoint
+    import pybundestag.parser.mdbdiff
+    import pybundestag.database.sqlitestore
+    import pybundestag.analysis.corpusstats
     import argparse
     import os
+    import sys
     import re
     import json
     import pandas as pd
 
         # Parse User Arguments
-    arg_parser = argparse.ArgumentParser(description='Parse Bundestag protocols and MdBs to CSV or JSON files')
-    arg_parser.add_argument("entity", help = "The object to parse [protocol or mdb]")
+    arg_parser = argparse.ArgumentParser(description='Parse Bundestag protocols and MdBs to CSV, JSON or SQLite files')
+    arg_parser.add_argument("entity", help = "The object to parse [protocol, mdb or stats]")
     arg_parser.add_argument("input", help = "Input for parsing. If folder, all XML files are parsed")
-    arg_parser.add_argument("output", help = "Output file. Should end in either .csv or .json")
+    arg_parser.add_argument("output", help = "Output file. Should end in either .csv, .json or .sqlite")
     arg_parser.add_argument("-s", "--seperator", required = False, default = ",", 
                         help = "Seperator for csv File")
     arg_parser.add_argument("-m", "--meta", required = False, default = False,
                         help="Flag for whether or not meta data should be added",
                         action="store_true")
+    arg_parser.add_argument("-n", "--normalize", required = False, default = False,
+                        help="Flag for whether or not the text of speeches should be normalized",
+                        action="store_true")
     arg_parser.add_argument("-p", "--period", required = False, default = None,
                             help = "Extract MdBs for parliamentary period")
     arg_parser.add_argument("-i", "--institutions", required = False, default = None,
                             help = "Check for MdB membership of specified institutions (seperated by ';')")
+    arg_parser.add_argument("-d", "--diff", required = False, default = None,
+                            help = "Snapshot of a former MdB release. Only added or changed MdBs are extracted")
+    arg_parser.add_argument("-g", "--groupby", required = False, default = "faction",
+                            help = "Group for statistics [faction, speaker, session or period]. Combine groups with ',' (e.g. period,faction)")
+    arg_parser.add_argument("-r", "--report", required = False, default = None,
+                            help = "File to write data quality issues to. Should end in either .csv or .json")
+    arg_parser.add_argument("--strict", required = False, default = False,
+                            help = "Flag for whether or not data quality issues should raise an error",
+                            action="store_true")
+    arg_parser.add_argument("-c", "--checkpoint", required = False, default = None,
+                            help = "Folder to record parsed protocols in, so an interrupted run can be resumed")
     args = arg_parser.parse_args()
     
     # Wrangle Arguments
@@ -39,11 +93,17 @@ def main():
     
         # Catch Bad User Input
             # Wrong Entity
-    if args.entity not in ["protocol", "mdb"]:
-        raise ValueError("entity should be protocol or mdb")
+    if args.entity not in ["protocol", "mdb", "stats"]:
+        raise ValueError("entity should be protocol, mdb or stats")
             # Wrong Output File Type
-    if (args.output.endswith("csv") == False) & (args.output.endswith("json") == False):
-        raise ValueError("Your output must end in either '.csv' or '.json'.")
+    if output_extension not in ["csv", "json", "sqlite"]:
+        raise ValueError("Your output must end in either '.csv', '.json' or '.sqlite'.")
+            # Wrong Group for Statistics
+    if any([x.strip().lower() not in pybundestag.analysis.corpusstats.GROUPS for x in args.groupby.split(",")]):
+        raise ValueError("groupby should be faction, speaker, session or period (seperated by ',')")
+            # Wrong Report File Type
+    if (args.report is not None) and (args.report.endswith((".csv", ".json")) == False):
+        raise ValueError("Your report must end in either '.csv' or '.json'.")
 
         # Create List of Input Files
     if os.path.isdir(args.input):
@@ -56,18 +116,66 @@ def main():
         raise ValueError("Your input is not a xml file or a folder.")
     
         # Map internal output format to user input
-    extension_dict = {"csv" : "dataframe", "json" : "json"}
+    extension_dict = {"csv" : "dataframe", "json" : "json", "sqlite" : "list"}
+
+        # Init List of Data Quality Issues
+    report_list = []
     
     # Parse Protocols
     if args.entity == "protocol":
 
+        # Look Up Files completed in a former Run with the same Options
+        if args.checkpoint is not None:
+            if output_extension == "sqlite":
+                checkpoint_options = {"meta" : args.meta, "normalize" : args.normalize,
+                                      "output" : "sqlite", "database" : os.path.abspath(args.output)}
+            else:
+                checkpoint_options = {"meta" : args.meta, "normalize" : args.normalize,
+                                      "output" : "records", "database" : None}
+            pybundestag.parser.checkpoint.check_options(args.checkpoint, checkpoint_options)
+            completed = pybundestag.parser.checkpoint.read_completed(args.checkpoint)
+        else:
+            completed = set()
+
+        # Load Protocols into SQLite Database
+        if output_extension == "sqlite":
+            connection = pybundestag.database.sqlitestore.connect_database(args.output)
+            parser_count = 1
+            failed_count = 0
+            for file in content:
+                # Parse Single File and write Speeches straight to Database
+                print("\rParsing File: {} of {}".format(parser_count, len(content)), end = "")
+                parser_count += 1
+                # Speeches of completed Files are already in Database, only report their Issues
+                if os.path.basename(file) in completed:
+                    if pybundestag.parser.checkpoint.has_partial(args.checkpoint, file):
+                        report_list.extend(pybundestag.parser.checkpoint.read_partial(args.checkpoint, file)[1])
+                    continue
+                # Skip Files that can not be parsed
+                speeches_tmp, file_report = _parse_protocol_file(file, args)
+                if speeches_tmp is None:
+                    failed_count += 1
+                    continue
+                pybundestag.database.sqlitestore.write_speeches(connection, speeches_tmp)
+                report_list.extend(file_report)
+                if args.checkpoint is not None:
+                    pybundestag.parser.checkpoint.write_partial(args.checkpoint, file, issues = file_report)
+            # Index Speeches after Bulk Load
+            pybundestag.database.sqlitestore.create_indexes(connection)
+            connection.close()
+
+            # Exit with Success
+            if failed_count > 0:
+                print("\n{} File(s) could not be parsed".format(failed_count), end = "")
+            print("\nSpeeches written to: {}".format(args.output))
+
         # Parse if Input is Single File
-        if len(content) == 1:
+        elif len(content) == 1:
             # Read in Single Protocol and collect all Speeches
-            protocol = pybundestag.parser.speechparser.read_protocol(content[0])
-            speeches = pybundestag.parser.speechparser.collect_speeches(protocol,
-                                                            output = extension_dict[output_extension],
-                                                            metadata = args.meta)
+            speeches, file_report = _parse_protocol_file(content[0], args,
+                                                         output = extension_dict[output_extension],
+                                                         skip = False)
+            report_list.extend(file_report)
             # Write CSV to Output Path
             if output_extension == "csv":
                 speeches.to_csv(args.output, sep = args.seperator,
@@ -87,16 +195,29 @@ def main():
             # Init Counter and Result List for Loop
             parser_count = 1
             conent_len = str(len(content))
+            failed_count = 0
             speeches_list = []
             for file in content:
                 # Parse Single File and append Output to Result List
                 print("\rParsing File: {} of {}".format(parser_count, conent_len), end = "")
                 parser_count += 1
-                protocol = pybundestag.parser.speechparser.read_protocol(file)
-                speeches_tmp = pybundestag.parser.speechparser.collect_speeches(protocol, 
-                                                                    output = "list", 
-                                                                    metadata = args.meta)
+                # Reuse Output of Files completed in a former Run
+                if (os.path.basename(file) in completed) and \
+                   pybundestag.parser.checkpoint.has_partial(args.checkpoint, file):
+                    speeches_tmp, file_report = pybundestag.parser.checkpoint.read_partial(args.checkpoint, file)
+                    speeches_list.extend(speeches_tmp)
+                    report_list.extend(file_report)
+                    continue
+                # Skip Files that can not be parsed
+                speeches_tmp, file_report = _parse_protocol_file(file, args)
+                if speeches_tmp is None:
+                    failed_count += 1
+                    continue
+                if args.checkpoint is not None:
+                    pybundestag.parser.checkpoint.write_partial(args.checkpoint, file, speeches_tmp,
+                                                                issues = file_report)
                 speeches_list.extend(speeches_tmp)
+                report_list.extend(file_report)
             # Write Result as CSV to Output Path
             if output_extension == "csv":
                 result_df = pd.DataFrame(speeches_list)
@@ -109,6 +230,8 @@ def main():
                     f.writelines(result)
                     
             # Exit with Success
+            if failed_count > 0:
+                print("\n{} File(s) could not be parsed".format(failed_count), end = "")
             print("\nSpeeches written to: {}".format(args.output))
             
         else:
@@ -116,19 +239,96 @@ def main():
 
         
 
+    # Compute Statistics on Protocols
+    if args.entity == "stats":
+
+        # Statistics are written to csv or json only
+        if output_extension == "sqlite":
+            raise ValueError("Statistics can only be written to '.csv' or '.json'.")
+        # Aggregate every Protocol on its own, so Texts are not kept in Memory
+        parser_count = 1
+        failed_count = 0
+        aggregates = []
+        for file in content:
+            print("\rParsing File: {} of {}".format(parser_count, len(content)), end = "")
+            parser_count += 1
+            # Skip Files that can not be parsed
+            speeches_tmp, file_report = _parse_protocol_file(file, args, metadata = True)
+            if speeches_tmp is None:
+                failed_count += 1
+                continue
+            aggregates.append(pybundestag.analysis.corpusstats.aggregate_speeches(speeches_tmp,
+                                                                                  by = args.groupby))
+            report_list.extend(file_report)
+        # Combine Aggregates and add Shares
+        result_df = pybundestag.analysis.corpusstats.combine_aggregates(aggregates, by = args.groupby)
+        result_df = pybundestag.analysis.corpusstats.add_shares(result_df, by = args.groupby)
+        # Write CSV to Output Path
+        if output_extension == "csv":
+            result_df.to_csv(args.output, sep = args.seperator,
+                             encoding = "utf-8", index = False)
+        # Write JSON to Output Path
+        elif output_extension == "json":
+            # Missing Groups are written as null, json knows no NaN
+            result_df = result_df.astype(object).where(result_df.notna(), None)
+            with open(args.output, mode = "w", encoding = "utf-8") as f:
+                f.writelines(json.dumps(result_df.to_dict(orient = "records"), ensure_ascii = False, indent = 1))
+
+        # Exit with Success
+        if failed_count > 0:
+            print("\n{} File(s) could not be parsed".format(failed_count), end = "")
+        print("\nStatistics written to: {}".format(args.output))
+
     # Parse MdBs
     if args.entity == "mdb":
         
         # Parse if Input is Single File
         if len(content) == 1:
             # Read in Single MdB List and collect all MdBs
-            mdbs = pybundestag.parser.mdbparser.read_mdbs(content[0])
+            file = content[0]
+            file_report = []
+            mdbs = pybundestag.parser.mdbparser.read_mdbs(file)
+            # Reduce to MdBs changed since former Release
+            if args.diff is not None:
+                snapshot_options = {"period" : args.period, "institutions" : args.institutions}
+                if os.path.isfile(args.diff):
+                    snapshot, former_options = pybundestag.parser.mdbdiff.read_snapshot(args.diff)
+                    # Snapshot only fits Runs with the same Extraction Options
+                    if former_options != snapshot_options:
+                        print("Snapshot was taken with other options ({}), extracting all MdBs".format(former_options))
+                        snapshot = dict()
+                else:
+                    snapshot = dict()
+                diff = pybundestag.parser.mdbdiff.diff_mdbs(mdbs, snapshot)
+                mdbs = pybundestag.parser.mdbdiff.filter_changed(mdbs, diff)
+                print("MdBs added: {}, removed: {}, changed: {}".format(len(diff["Added"]),
+                                                                       len(diff["Removed"]),
+                                                                       len(diff["Changed"])))
+                # Report Periods of changed MdBs
+                period_counts = pybundestag.parser.mdbdiff.count_period_changes(diff)
+                for kind in period_counts:
+                    counts = ["{} ({} MdBs)".format(x, period_counts[kind][x]) for x in sorted(period_counts[kind])]
+                    print("Periods {}: {}".format(kind.lower(), ", ".join(counts) if len(counts) > 0 else "none"))
             mdbs = pybundestag.parser.mdbparser.collect_mdbs(mdbs = mdbs,
                                                  output = extension_dict[output_extension],
                                                  period = args.period,
-                                                 institutions = args.institutions)
+                                                 institutions = args.institutions,
+                                                 report = file_report,
+                                                 strict = args.strict)
+            report_list.extend(_tag_issues(file_report, file))
+            # Write to SQLite Database
+            if output_extension == "sqlite":
+                connection = pybundestag.database.sqlitestore.connect_database(args.output)
+                # Delete removed MdBs and Periods before writing added or changed MdBs
+                if args.diff is not None:
+                    pybundestag.database.sqlitestore.delete_mdbs(connection, diff["Removed"])
+                    for mdbid in diff["Periods"]:
+                        pybundestag.database.sqlitestore.delete_mdbs(connection, [mdbid],
+                                                                     periods = diff["Periods"][mdbid]["Removed"])
+                pybundestag.database.sqlitestore.write_mdbs(connection, mdbs)
+                connection.close()
             # Write CSV to Output Path
-            if output_extension == "csv":
+            elif output_extension == "csv":
                 mdbs.to_csv(args.output, sep = args.seperator,
                             encoding = "utf-8", index = False)
             # Write JSON to Output Path
@@ -137,9 +337,24 @@ def main():
                     f.writelines(mdbs)
             else:
                 raise ValueError("Your output format {} is neither 'csv' or 'json'.".format(output_extension))
+            # Update Snapshot once Output is written
+            if args.diff is not None:
+                pybundestag.parser.mdbdiff.write_snapshot(diff["Snapshot"], args.diff,
+                                                          options = snapshot_options)
                 
         # Exit with Success
         print("MdBs written to: {}".format(args.output))
+
+    # Write Data Quality Issues to Report
+    if args.report is not None:
+        report_df = pd.DataFrame(report_list, columns = ["File", "Record", "Field", "Issue"])
+        if args.report.endswith(".csv"):
+            report_df.to_csv(args.report, sep = args.seperator,
+                             encoding = "utf-8", index = False)
+        else:
+            with open(args.report, mode = "w", encoding = "utf-8") as f:
+                f.writelines(json.dumps(report_list, ensure_ascii = False, indent = 1))
+        print("{} Data Quality Issue(s) written to: {}".format(len(report_list), args.report))
         
 
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Import Modules
+from pybundestag.parser.textnormalizer import TOKEN_PATTERN
+import pandas as pd
+
+
+# Columns to group Speeches by
+GROUPS = {"faction" : ["Faction"],
+          "speaker" : ["SpeakerID", "Speaker"],
+          "session" : ["Period", "Session"],
+          "period" : ["Period"]}
+
+
+# Split combined Groups ('period,faction') into single Groups
+def _split_groups(by):
+    groups = [x.strip().lower() for x in by.split(",")]
+    for group in groups:
+        if group not in GROUPS:
+            raise ValueError("by must be one or more of {}, seperated by ','.".format(
+                    ", ".join(["'" + x + "'" for x in GROUPS])))
+    return(groups)
+
+# Look Up Columns of (combined) Group
+def _get_group(by):
+    columns = [GROUPS[x] for x in _split_groups(by)]
+    return(list(dict.fromkeys(sum(columns, []))))
+
+
+# Aggregate Speeches
+def aggregate_speeches(speeches, by = "faction"):
+    """Counts speeches and words per group
+
+    Computes the number of speeches and words for every
+    faction, speaker, session or parliamentary period.
+    Groups can be combined, e.g. 'period,faction' for
+    every faction within every parliamentary period.
+    Words are counted with vectorized string operations
+    on the whole column. If the speeches were normalized
+    with collect_speeches, TokenCount is used instead.
+
+    The result contains no text, so aggregates of many
+    protocols can be kept in memory and combined with
+    combine_aggregates afterwards.
+
+    Parameters
+    -----------
+    speeches: pandas.DataFrame or list of dict
+        Output from collect_speeches. Meta data is
+        needed to group by session or period.
+
+    by: string ['faction', 'speaker', 'session', 'period'];
+        default: 'faction'
+        The group to compute statistics for. Several
+        groups are seperated by ','.
+
+    Returns
+    -----------
+    result: pandas.DataFrame
+        A DataFrame with the group's columns, Speeches
+        (number of speeches), and Words (number of words).
+    """
+    group = _get_group(by)
+    speeches = pd.DataFrame(speeches)
+    # Make sure that Group Columns exist for empty Protocols
+    speeches = speeches.reindex(columns = list(dict.fromkeys(group + ["Text"] + list(speeches.columns))))
+    if "TokenCount" in speeches.columns:
+        words = speeches["TokenCount"].fillna(0)
+    else:
+        words = speeches["Text"].fillna("").astype(str).str.count(TOKEN_PATTERN.pattern)
+    frame = speeches[group].assign(Speeches = 1, Words = words.astype("int64"))
+    result = frame.groupby(group, dropna = False, sort = False).sum().reset_index()
+    return(result)
+
+# Combine Aggregates of several Protocols
+def combine_aggregates(aggregates, by = "faction"):
+    """Combines results of aggregate_speeches
+
+    Parameters
+    -----------
+    aggregates: list of pandas.DataFrame
+        Outputs from aggregate_speeches, each computed
+        with the same value for by.
+
+    by: string ['faction', 'speaker', 'session', 'period'];
+        default: 'faction'
+        The group the aggregates were computed for.
+        Several groups are seperated by ','.
+
+    Returns
+    -----------
+    result: pandas.DataFrame
+        The summed Speeches and Words per group.
+    """
+    group = _get_group(by)
+    if len(aggregates) == 0:
+        return(pd.DataFrame(columns = group + ["Speeches", "Words"]))
+    result = pd.concat(aggregates, ignore_index = True)
+    result = result.groupby(group, dropna = False).sum().reset_index()
+    return(result)
+
+# Add Shares to Aggregate
+def add_shares(aggregate, by = "faction"):
+    """Adds speaking shares to an aggregate
+
+    For a single group, shares refer to all speeches and
+    words in the aggregate. For combined groups (e.g.
+    'period,faction'), shares refer to the speeches and
+    words within the first (outer) group, e.g. the share
+    of a faction within its parliamentary period.
+
+    Parameters
+    -----------
+    aggregate: pandas.DataFrame
+        Output from aggregate_speeches or
+        combine_aggregates.
+
+    by: string ['faction', 'speaker', 'session', 'period'];
+        default: 'faction'
+        The group the aggregate was computed for.
+        Several groups are seperated by ','.
+
+    Returns
+    -----------
+    result: pandas.DataFrame
+        The aggregate with the additional columns
+        SpeechShare and WordShare (share of speeches
+        and words) and WordsPerSpeech.
+    """
+    groups = _split_groups(by)
+    result = aggregate.copy()
+    if len(groups) > 1:
+        totals = result.groupby(GROUPS[groups[0]], dropna = False)[["Speeches", "Words"]].transform("sum")
+    else:
+        totals = result[["Speeches", "Words"]].sum()
+    result["SpeechShare"] = result["Speeches"] / totals["Speeches"]
+    result["WordShare"] = result["Words"] / totals["Words"]
+    result["WordsPerSpeech"] = result["Words"] / result["Speeches"]
+    return(result)
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Import Modules
+import sqlite3
+import itertools
+import pandas as pd
+
+
+# Columns every Table is created with
+SPEECH_COLUMNS = ["SpeechID", "SpeakerID", "Speaker", "Faction", "Role",
+                  "Text", "Location", "Date", "Period", "Session"]
+MDB_COLUMNS = ["ID", "FirstName", "LastName", "Name", "AcademicTitle",
+               "BirthYear", "BirthPlace", "DeathYear", "Gender", "Party",
+               "Occupation", "Periods", "Vita"]
+PERIOD_COLUMNS = ["ID", "Period", "District", "Mandate", "List"]
+
+# Primary Keys of Tables
+KEYS = {"speeches" : ["SpeechID"],
+        "mdbs" : ["ID"],
+        "mdb_periods" : ["ID", "Period"]}
+
+# Columns of the Speeches Table to be indexed
+SPEECH_INDEXES = ["SpeakerID", "Faction", "Period", "Session", "Date"]
+
+
+# Quote Column and Table Names for SQL Statements
+def _quote(name):
+    return('"' + str(name).replace('"', '""') + '"')
+
+# Create Tables if not present
+def _create_schema(connection):
+    speech_columns = ", ".join([_quote(x) + " TEXT" for x in SPEECH_COLUMNS[1:]])
+    mdb_columns = ", ".join([_quote(x) + " TEXT" for x in MDB_COLUMNS[1:]])
+    period_columns = ", ".join([_quote(x) + " TEXT" for x in PERIOD_COLUMNS[2:]])
+    with connection:
+        # SQLite accepts NULL in Primary Keys unless declared NOT NULL
+        connection.execute("CREATE TABLE IF NOT EXISTS speeches "
+                           "(SpeechID TEXT NOT NULL PRIMARY KEY, {})".format(speech_columns))
+        # Personal Information, one Row per MdB
+        connection.execute("CREATE TABLE IF NOT EXISTS mdbs "
+                           "(ID TEXT NOT NULL PRIMARY KEY, {})".format(mdb_columns))
+        # Period specific Information, one Row per MdB and Period
+        connection.execute("CREATE TABLE IF NOT EXISTS mdb_periods "
+                           "(ID TEXT NOT NULL, Period TEXT NOT NULL, {}, "
+                           "PRIMARY KEY (ID, Period))".format(period_columns))
+
+# List Columns of Table
+def _get_columns(connection, table):
+    columns = [x[1] for x in connection.execute("PRAGMA table_info({})".format(_quote(table)))]
+    return(columns)
+
+# Add Columns not yet present in Table (e.g. Institution Dummies)
+def _ensure_columns(connection, table, columns):
+    present = _get_columns(connection, table)
+    missing = [x for x in columns if x not in present]
+    with connection:
+        for column in missing:
+            connection.execute("ALTER TABLE {} ADD COLUMN {}".format(_quote(table), _quote(column)))
+
+# Insert Records in batched Transactions
+def _write_records(connection, table, records, batch_size, upsert, replace = False):
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    records = iter(records)
+    keys = KEYS[table]
+    written = 0
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if len(batch) == 0:
+            break
+        # Skip Records without Key, they could never be updated
+        batch = [x for x in batch if all([x.get(key) is not None for key in keys])]
+        if len(batch) == 0:
+            continue
+        # Collect Columns of Batch in Order of first Appearance
+        columns = list(dict.fromkeys(itertools.chain.from_iterable(batch)))
+        _ensure_columns(connection, table, columns)
+        statement = "INSERT INTO {} ({}) VALUES ({})".format(_quote(table),
+                                                             ", ".join([_quote(x) for x in columns]),
+                                                             ", ".join(["?"] * len(columns)))
+        # Replace present Records entirely
+        if upsert and replace:
+            statement = statement.replace("INSERT", "INSERT OR REPLACE", 1)
+        # Update only the given Columns of present Records
+        elif upsert:
+            updates = [_quote(x) + " = excluded." + _quote(x) for x in columns if x not in keys]
+            if len(updates) > 0:
+                statement += " ON CONFLICT ({}) DO UPDATE SET {}".format(
+                        ", ".join([_quote(x) for x in keys]), ", ".join(updates))
+            else:
+                statement += " ON CONFLICT DO NOTHING"
+        rows = [tuple(x.get(column) for column in columns) for x in batch]
+        with connection:
+            connection.executemany(statement, rows)
+        written += len(rows)
+    return(written)
+
+
+# Open SQLite Database
+def connect_database(path):
+    """Opens a SQLite database for speeches and MdBs
+
+    Connects to the SQLite database at the given path
+    and creates the tables 'speeches', 'mdbs' (personal
+    information) and 'mdb_periods' (period specific
+    information) if they do not exist yet. The file is
+    created if necessary.
+
+    Parameters
+    -----------
+    path : string
+        The path to the SQLite database, usually
+        ending in '.sqlite'.
+
+    Returns
+    -----------
+    connection : sqlite3.Connection
+        An open connection to the database.
+    """
+    connection = sqlite3.connect(path)
+    _create_schema(connection)
+    return(connection)
+
+# Index Speeches Table
+def create_indexes(connection):
+    """Creates indexes on the speeches table
+
+    Indexes SpeakerID, Faction, Period, Session and
+    Date of the speeches table. Indexes that already
+    exist are left untouched. Bulk loads are faster
+    if this is called after all speeches were written.
+
+    Parameters
+    -----------
+    connection : sqlite3.Connection
+        The output of connect_database.
+    """
+    with connection:
+        for column in SPEECH_INDEXES:
+            connection.execute("CREATE INDEX IF NOT EXISTS {} ON speeches ({})".format(
+                    _quote("idx_speeches_" + column), _quote(column)))
+
+# Write Speeches to Database
+def write_speeches(connection, speeches, batch_size = 1000, upsert = True):
+    """Writes speeches into the speeches table
+
+    Inserts speeches as returned by collect_speeches
+    with output set to 'list'. Records are inserted in
+    batches, each batch within a single transaction.
+
+    Parameters
+    -----------
+    connection : sqlite3.Connection
+        The output of connect_database.
+
+    speeches : iterable of dict
+        The speeches to write. Can be a list or any
+        other iterable, e.g. a generator. Speeches
+        without SpeechID are skipped (collect_speeches
+        reports them as data quality issues).
+
+    batch_size : int; default: 1000
+        The number of speeches per transaction.
+
+    upsert : boolean; default: True
+        If True, speeches already present in the
+        database are replaced by SpeechID. This way,
+        newly parsed protocols can be loaded again.
+        If False, duplicates raise an IntegrityError.
+
+    Returns
+    -----------
+    written : int
+        The number of speeches written.
+    """
+    return(_write_records(connection, "speeches", speeches, batch_size, upsert, replace = True))
+
+# Write MdBs to Database
+def write_mdbs(connection, mdbs, batch_size = 1000, upsert = True):
+    """Writes MdBs into the mdbs and mdb_periods tables
+
+    Inserts MdBs as returned by collect_mdbs with
+    output set to 'list'. Personal information is
+    written to the table 'mdbs' with one row per ID.
+    If the MdBs were collected for a parliamentary
+    period, the period specific information is written
+    to the table 'mdb_periods' with one row per ID and
+    Period, so MdBs of different parliamentary periods
+    can be loaded one after another. Columns for
+    institution memberships are added on demand.
+
+    Parameters
+    -----------
+    connection : sqlite3.Connection
+        The output of connect_database.
+
+    mdbs : iterable of dict
+        The MdBs to write. MdBs without ID are skipped
+        (collect_mdbs reports them as data quality
+        issues).
+
+    batch_size : int; default: 1000
+        The number of MdBs per transaction.
+
+    upsert : boolean; default: True
+        If True, MdBs already present in the
+        database are updated. Columns not present in
+        the new records are kept. If False, duplicates
+        raise an IntegrityError.
+
+    Returns
+    -----------
+    written : int
+        The number of MdBs written.
+    """
+    personal_list = []
+    period_list = []
+    for mdb in mdbs:
+        personal = {x : mdb[x] for x in mdb if (x not in PERIOD_COLUMNS[1:]) and (not x.startswith("member_"))}
+        # Period specific Information is only present if collected for a Period
+        if "Mandate" in mdb:
+            period_list.append({x : mdb[x] for x in mdb if (x == "ID") or (x not in personal)})
+        else:
+            personal["Periods"] = mdb.get("Period")
+        personal_list.append(personal)
+    written = _write_records(connection, "mdbs", personal_list, batch_size, upsert)
+    _write_records(connection, "mdb_periods", period_list, batch_size, upsert)
+    return(written)
+
+# Delete MdBs from Database
+def delete_mdbs(connection, ids, periods = None):
+    """Deletes MdBs from the mdbs and mdb_periods tables
+
+    Parameters
+    -----------
+    connection : sqlite3.Connection
+        The output of connect_database.
+
+    ids : iterable of str
+        The IDs of the MdBs to delete.
+
+    periods : iterable of str [optional]; default: None
+        If given, only the period specific information
+        of these parliamentary periods is deleted and
+        personal information is kept.
+
+    Returns
+    -----------
+    deleted : int
+        The number of rows deleted.
+    """
+    ids = [(x,) for x in ids]
+    changes = connection.total_changes
+    with connection:
+        if periods is None:
+            connection.executemany("DELETE FROM mdbs WHERE ID = ?", ids)
+            connection.executemany("DELETE FROM mdb_periods WHERE ID = ?", ids)
+        else:
+            pairs = [(x[0], str(y)) for x in ids for y in periods]
+            connection.executemany("DELETE FROM mdb_periods WHERE ID = ? AND Period = ?", pairs)
+    deleted = connection.total_changes - changes
+    return(deleted)
+
+# Join Speeches and MdBs
+def join_speeches_mdbs(connection, output = "dataframe"):
+    """Joins speeches with data on their speakers
+
+    Joins every speech with the MdB whose ID equals
+    the speech's SpeakerID. If the speech carries meta
+    data, the MdB's period specific information for
+    the speech's parliamentary period is joined as
+    well. Every speech is returned exactly once.
+
+    Parameters
+    -----------
+    connection : sqlite3.Connection
+        The output of connect_database.
+
+    output: string ['dataframe', 'list'];
+            default: 'dataframe'
+        The desired output format.
+
+    Returns
+    -----------
+    result: Either pandas.DataFrame or list
+        All speeches joined with information on
+        their speaker. Speeches of speakers that
+        are not in the mdbs table are kept.
+    """
+    # Select MdB Columns without duplicating Speech Columns
+    mdb_columns = ["mdbs." + _quote(x) for x in _get_columns(connection, "mdbs") if x != "ID"]
+    period_columns = ["mdb_periods." + _quote(x) for x in _get_columns(connection, "mdb_periods")
+                      if x not in ["ID", "Period"]]
+    # Both Joins are on the full Primary Key, so no Speech is duplicated
+    query = ("SELECT speeches.*, {} FROM speeches "
+             "LEFT JOIN mdbs ON mdbs.ID = speeches.SpeakerID "
+             "LEFT JOIN mdb_periods ON mdb_periods.ID = speeches.SpeakerID "
+             "AND mdb_periods.Period = speeches.Period").format(
+                     ", ".join(mdb_columns + period_columns))
+    if output == "dataframe":
+        result = pd.read_sql_query(query, connection)
+    elif output == "list":
+        cursor = connection.execute(query)
+        columns = [x[0] for x in cursor.description]
+        result = [dict(zip(columns, x)) for x in cursor]
+    else:
+        raise ValueError("Output must either be 'dataframe' or 'list'.")
+    return(result)
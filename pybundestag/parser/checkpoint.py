@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Import Modules
+import os
+import json
+
+
+# Name of File listing all completed Input Files
+MANIFEST = "completed.txt"
+
+# Name of File holding the Options of the Run
+OPTIONS = "options.json"
+
+
+# Path of Partial Output for an Input File
+def _partial_path(folder, path):
+    return(os.path.join(folder, os.path.basename(path) + ".json"))
+
+# Tie Checkpoint Folder to Options of Run
+def check_options(folder, options):
+    """Makes sure a checkpoint folder fits the current run
+
+    Partial outputs depend on the options they were
+    parsed with (e.g. meta data or normalization). The
+    options of the first run are stored in the
+    checkpoint folder. Later runs with other options
+    are refused, so partial outputs are never mixed.
+
+    Parameters
+    -----------
+    folder : string
+        The path to the checkpoint folder. It is created
+        if it does not exist yet.
+
+    options : Dict
+        The options of the current run. Must be
+        serializable as json.
+
+    Raises
+    -----------
+    ValueError
+        If the folder was written with other options.
+    """
+    os.makedirs(folder, exist_ok = True)
+    path = os.path.join(folder, OPTIONS)
+    if os.path.isfile(path):
+        with open(path, mode = "r", encoding = "utf-8") as f:
+            stored = json.load(f)
+        if stored != options:
+            raise ValueError("Checkpoint folder {} was written with other options ({}). "
+                             "Use the same options or a new folder.".format(folder, stored))
+    else:
+        with open(path, mode = "w", encoding = "utf-8") as f:
+            json.dump(options, f, ensure_ascii = False)
+
+# Read Completed Files from Checkpoint Folder
+def read_completed(folder):
+    """Lists all input files completed in former runs
+
+    Reads the manifest of a checkpoint folder. Every
+    input file that was parsed successfully in a former
+    run is listed there by its file name. The folder is
+    created if it does not exist yet.
+
+    Parameters
+    -----------
+    folder : string
+        The path to the checkpoint folder.
+
+    Returns
+    -----------
+    completed : set of str
+        The file names (without directory) of all
+        completed input files.
+    """
+    os.makedirs(folder, exist_ok = True)
+    manifest = os.path.join(folder, MANIFEST)
+    if not os.path.isfile(manifest):
+        return(set())
+    with open(manifest, mode = "r", encoding = "utf-8") as f:
+        completed = set([x.strip() for x in f if x.strip() != ""])
+    return(completed)
+
+# Record Completed File and its Partial Output
+def write_partial(folder, path, records = None, issues = None):
+    """Marks an input file as completed
+
+    Stores the records and data quality issues parsed
+    from a single input file in the checkpoint folder and
+    adds the file to the manifest. The partial output is
+    written to a temporary file first, so a run that is
+    killed never leaves a half written partial output
+    behind.
+
+    Parameters
+    -----------
+    folder : string
+        The path to the checkpoint folder.
+
+    path : string
+        The path to the input file that was parsed.
+
+    records : list of dict [optional]; default: None
+        The records parsed from the input file. None if
+        the records are not needed again (e.g. if they
+        were already written to a database).
+
+    issues : list of dict [optional]; default: None
+        The data quality issues found in the input file,
+        so a resumed run can report them again.
+    """
+    partial = _partial_path(folder, path)
+    content = {"Records" : records,
+               "Issues" : [] if issues is None else issues}
+    with open(partial + ".tmp", mode = "w", encoding = "utf-8") as f:
+        json.dump(content, f, ensure_ascii = False)
+    os.replace(partial + ".tmp", partial)
+    with open(os.path.join(folder, MANIFEST), mode = "a", encoding = "utf-8") as f:
+        f.write(os.path.basename(path) + "\n")
+
+# Check for Partial Output of Completed File
+def has_partial(folder, path):
+    """Checks if the partial output of an input file was stored
+
+    Parameters
+    -----------
+    folder : string
+        The path to the checkpoint folder.
+
+    path : string
+        The path to the input file.
+
+    Returns
+    -----------
+    present : boolean
+        True if write_partial stored a partial output
+        for the input file.
+    """
+    return(os.path.isfile(_partial_path(folder, path)))
+
+# Read Partial Output of Completed File
+def read_partial(folder, path):
+    """Reads the partial output of a completed input file
+
+    Parameters
+    -----------
+    folder : string
+        The path to the checkpoint folder.
+
+    path : string
+        The path to the input file that was parsed.
+
+    Returns
+    -----------
+    records : list of dict
+        The records stored by write_partial. None if
+        no records were stored.
+
+    issues : list of dict
+        The data quality issues stored by write_partial.
+    """
+    with open(_partial_path(folder, path), mode = "r", encoding = "utf-8") as f:
+        content = json.load(f)
+    return(content["Records"], content["Issues"])
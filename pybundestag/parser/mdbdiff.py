@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Import Modules
+import hashlib
+import json
+import os
+import re
+
+
+# Whitespace between Tags (ignored when hashing)
+TAG_SPACE_PATTERN = re.compile(r">\s+<")
+
+
+# Hash Content of an XML Element
+def _hash_element(element):
+    content = TAG_SPACE_PATTERN.sub("><", str(element)).strip()
+    return(hashlib.sha256(content.encode("utf-8")).hexdigest())
+
+# Get ID of MdB
+def _get_id(mdb):
+    element = mdb.find("id")
+    if element is None:
+        return(None)
+    return(element.get_text())
+
+# Compare two Dictionaries of Hashes
+def _compare(old, new):
+    added = [x for x in new if x not in old]
+    removed = [x for x in old if x not in new]
+    changed = [x for x in new if (x in old) and (old[x] != new[x])]
+    return(added, removed, changed)
+
+
+# Create Snapshot of MdBs
+def snapshot_mdbs(mdbs):
+    """Creates a snapshot of content hashes for all MdBs
+
+    Hashes every MdB of read_mdbs' output as a whole and
+    every parliamentary period of the MdB on its own.
+    Snapshots are small and can be stored with
+    write_snapshot to detect changes in later releases
+    of the master data.
+
+    Parameters
+    -----------
+    mdbs: BeautifulSoup
+        Output from read_mdbs function.
+
+    Returns
+    -----------
+    snapshot: Dict
+        A dictionary with the MdB's ID as key. Values
+        are dictionaries with the keys 'Hash' (hash of
+        the entire MdB) and 'Periods' (a dictionary of
+        hashes by parliamentary period).
+    """
+    snapshot = dict()
+    for mdb in mdbs:
+        periods = dict()
+        for period in mdb.find_all("wahlperiode"):
+            wp = period.find("wp")
+            if wp is not None:
+                periods[wp.get_text()] = _hash_element(period)
+        snapshot[_get_id(mdb)] = {"Hash" : _hash_element(mdb),
+                                  "Periods" : periods}
+    return(snapshot)
+
+# Write Snapshot to File
+def write_snapshot(snapshot, path, options = None):
+    """Writes a snapshot to a json file
+
+    Parameters
+    -----------
+    snapshot: Dict
+        Output from snapshot_mdbs or diff_mdbs.
+
+    path : string
+        The path of the json file.
+
+    options : Dict [optional]; default: None
+        The options the MdBs were extracted with (e.g.
+        period and institutions). Stored along with the
+        snapshot, so later runs can check whether the
+        snapshot fits their extraction.
+    """
+    content = {"Options" : options,
+               "MdBs" : snapshot}
+    with open(path + ".tmp", mode = "w", encoding = "utf-8") as f:
+        json.dump(content, f, ensure_ascii = False)
+    os.replace(path + ".tmp", path)
+
+# Read Snapshot from File
+def read_snapshot(path):
+    """Reads a snapshot written by write_snapshot
+
+    Parameters
+    -----------
+    path : string
+        The path of the json file.
+
+    Returns
+    -----------
+    snapshot: Dict
+        The snapshot as created by snapshot_mdbs.
+
+    options : Dict
+        The options stored with the snapshot.
+    """
+    with open(path, mode = "r", encoding = "utf-8") as f:
+        content = json.load(f)
+    return(content["MdBs"], content["Options"])
+
+# Compare MdBs to Snapshot
+def diff_mdbs(mdbs, snapshot):
+    """Compares MdBs to a snapshot of a former release
+
+    Detects which MdBs were added, removed or changed
+    since the snapshot was taken. For every changed
+    MdB, the added, removed and changed parliamentary
+    periods are reported as well.
+
+    Parameters
+    -----------
+    mdbs: BeautifulSoup
+        Output from read_mdbs function for the new
+        release of the master data.
+
+    snapshot: Dict
+        Output from snapshot_mdbs or read_snapshot for
+        the former release of the master data.
+
+    Returns
+    -----------
+    diff: Dict
+        A dictionary with the keys 'Added', 'Removed'
+        and 'Changed' listing the IDs of MdBs, 'Periods'
+        containing a dictionary with the keys 'Added',
+        'Removed' and 'Changed' for every changed MdB,
+        and 'Snapshot' holding the snapshot of the new
+        release.
+    """
+    new_snapshot = snapshot_mdbs(mdbs)
+    old_hashes = {x : snapshot[x]["Hash"] for x in snapshot}
+    new_hashes = {x : new_snapshot[x]["Hash"] for x in new_snapshot}
+    added, removed, changed = _compare(old_hashes, new_hashes)
+    # Compare Periods of changed MdBs
+    periods = dict()
+    for mdbid in changed:
+        period_added, period_removed, period_changed = _compare(snapshot[mdbid]["Periods"],
+                                                                new_snapshot[mdbid]["Periods"])
+        periods[mdbid] = {"Added" : period_added,
+                          "Removed" : period_removed,
+                          "Changed" : period_changed}
+    diff = {"Added" : added,
+            "Removed" : removed,
+            "Changed" : changed,
+            "Periods" : periods,
+            "Snapshot" : new_snapshot}
+    return(diff)
+
+# Reduce List of MdBs to added or changed MdBs
+def filter_changed(mdbs, diff):
+    """Reduces MdBs to those added or changed
+
+    Use the result as input to collect_mdbs, so only
+    MdBs that were added or changed since the former
+    release are extracted.
+
+    Parameters
+    -----------
+    mdbs: BeautifulSoup
+        Output from read_mdbs function for the new
+        release of the master data.
+
+    diff: Dict
+        Output from diff_mdbs.
+
+    Returns
+    -----------
+    mdbs_filtered: list
+        All added or changed MdBs.
+    """
+    keep = set(diff["Added"] + diff["Changed"])
+    mdbs_filtered = [x for x in mdbs if _get_id(x) in keep]
+    return(mdbs_filtered)
+
+# Count Changes of Parliamentary Periods
+def count_period_changes(diff):
+    """Counts changed MdBs by parliamentary period
+
+    Parameters
+    -----------
+    diff: Dict
+        Output from diff_mdbs.
+
+    Returns
+    -----------
+    counts: Dict
+        A dictionary with the keys 'Added', 'Removed'
+        and 'Changed'. Each value is a dictionary with
+        the number of changed MdBs by parliamentary
+        period.
+    """
+    counts = {"Added" : dict(), "Removed" : dict(), "Changed" : dict()}
+    for mdbid in diff["Periods"]:
+        for kind in counts:
+            for period in diff["Periods"][mdbid][kind]:
+                counts[kind][period] = counts[kind].get(period, 0) + 1
+    return(counts)
@@ -4,6 +4,7 @@
 
 # Import Modules
 from bs4 import BeautifulSoup
+from pybundestag.parser.quality import DataQualityError, index_tags, get_text, report_issue
 import itertools
 import pandas as pd
 import json
@@ -37,7 +38,7 @@ def read_mdbs(path):
         return(mdbs)
         
 # Get Personal Information of Single MDB
-def parse_personal(mdb):
+def parse_personal(mdb, report = None, strict = False):
     """Get personal information of a single MdB
     
     Given a single MdB as input, this function will yield
@@ -51,6 +52,14 @@ def parse_personal(mdb):
         A single element of read_mdbs output, representing
         a single member of the German Bundestag.
         
+    report: list [optional]; default: None
+        A list to record data quality issues in
+        (missing ID or name). See quality.report_issue.
+        
+    strict: boolean; default: False
+        If True, data quality issues raise a
+        DataQualityError instead of being recorded.
+        
     Returns
     -----------
     personal_dict: Dict
@@ -61,84 +70,50 @@ def parse_personal(mdb):
         gender, party affiliation, occupation,
         parliamentary periods and a short CV.
     """
+    # Index Fields once instead of searching MdB for every Field
+    fields = index_tags(mdb)
     # Parse Id
-    try:
-        personalid = mdb.find("id").get_text()
-    except Exception:
-        personalid = None
+    personalid = get_text(fields, "id", empty_as_none = True)
+    if personalid is None:
+        report_issue(report, strict, None, "ID", "missing")
     # Parse First Name
-    try:
-        firstname = mdb.find("vorname").get_text()
-    except Exception:
-        firstname = None
+    firstname = get_text(fields, "vorname")
+    if firstname is None:
+        report_issue(report, strict, personalid, "FirstName", "missing")
     # Parse Last Name
-    try:
-        lastname = mdb.find("nachname").get_text()
-    except Exception:
-        lastname = None
+    lastname = get_text(fields, "nachname")
+    if lastname is None:
+        report_issue(report, strict, personalid, "LastName", "missing")
     # Parse Academic Title
-    try:
-        acad = mdb.find("akad_titel").get_text()
-        if acad == "":
-            acad = None
-    except Exception:
-        acad = None
+    acad = get_text(fields, "akad_titel", empty_as_none = True)
     # Parse Year of Birth
-    try:
-        birthyear = mdb.find("geburtsdatum").get_text()
-    except Exception:
-        birthyear = None
+    birthyear = get_text(fields, "geburtsdatum")
     # Parse Place of Birth
-    try:
-        birthplace = mdb.find("geburtsort").get_text()
-    except Exception:
-        birthplace = None
+    birthplace = get_text(fields, "geburtsort")
     # Parse Year of Death
-    try:
-        death = mdb.find("sterbedatum").get_text()
-        if death == "":
-            death = None
-    except Exception:
-        death = None
+    death = get_text(fields, "sterbedatum", empty_as_none = True)
     # Parse Gender
-    try:
-        gender = mdb.find("geschlecht").get_text()
-    except Exception:
-        gender = None
+    gender = get_text(fields, "geschlecht")
     # Parse Party
-    try:
-        party = mdb.find("partei_kurz").get_text()
-    except Exception:
-        party = None
+    party = get_text(fields, "partei_kurz")
     # Parse Occupation
-    try:
-        occupation = mdb.find("beruf").get_text()
-        if occupation == "":
-            occupation = None
-        else:
-            occupation = occupation.split(", ")
-            occupation = ";".join(occupation)
-    except Exception:
-        occupation = None
+    occupation = get_text(fields, "beruf", empty_as_none = True)
+    if occupation is not None:
+        occupation = occupation.split(", ")
+        occupation = ";".join(occupation)
     # Parse Parliamentary Periods
-    try:
-        period = mdb.find_all("wp")
-        period = [x.get_text() for x in period]
-        period = ";".join(period)
-    except Exception:
-        period = None
+    period = mdb.find_all("wp")
+    period = [x.get_text() for x in period]
+    period = ";".join(period)
     # Parse Vita
-    try:
-        vita = mdb.find("vita_kurz").get_text()
-    except Exception:
-        vita = None
+    vita = get_text(fields, "vita_kurz")
     
     # Collect to Dict
     personal_dict = {
             "ID" : personalid,
             "FirstName" : firstname,
             "LastName" : lastname,
-            "Name" : " ".join([firstname, lastname]),
+            "Name" : " ".join([x for x in [firstname, lastname] if x is not None]),
             "AcademicTitle" : acad,
             "BirthYear" : birthyear,
             "BirthPlace" : birthplace,
@@ -153,7 +128,7 @@ def parse_personal(mdb):
     return(personal_dict)
     
 # Look Up Plenary Period Specific Information for MdB
-def parse_period(mdb, period, institutions = None):
+def parse_period(mdb, period, institutions = None, report = None, strict = False):
     """Gather period specific data for a MdB
     
     Given a single mdb and a parliamentary period,
@@ -181,6 +156,14 @@ def parse_period(mdb, period, institutions = None):
         not the MdB was a member in during the
         parliamentary period.
         
+    report: list [optional]; default: None
+        A list to record an unknown period in. See
+        quality.report_issue.
+        
+    strict: boolean; default: False
+        If True, an unknown period raises a
+        DataQualityError.
+        
     Returns
     -----------
     period_dict: Dict
@@ -200,35 +183,22 @@ def parse_period(mdb, period, institutions = None):
     period = str(period)
     # Filter List of Parliamentary Periods to Period
     periods_mdb = mdb.find_all("wahlperiode")
-    try:
-        period_result = [x for x in periods_mdb if x.find("wp").get_text() == period][0]
-    except IndexError:
+    period_result = [x for x in periods_mdb if get_text(x, "wp") == period]
+    if len(period_result) == 0:
+        report_issue(report, strict, get_text(mdb, "id"), "Period", "unknown")
         raise ValueError("MdB seems not be part of parliamentary period")
+    period_result = period_result[0]
     # Extract Information for given Period
     # Electoral District
-    try:
-        district = period_result.find("wkr_name").get_text()
-        if district == "":
-            district = None
-    except Exception:
-        district = None
+    district = get_text(period_result, "wkr_name", empty_as_none = True)
     # Mandate
-    try:
-        mandate = period_result.find("mandatsart").get_text()
-    except Exception:
-        mandate = None
+    mandate = get_text(period_result, "mandatsart")
     # List
-    try:
-        elec_list = period_result.find("liste").get_text()
-    except Exception:
-        elec_list = None
+    elec_list = get_text(period_result, "liste")
     # Check for Institution Membership
+    membership_dict = dict()
     if type(institutions) is list:
-        membership_dict = dict()
-        try:
-            mdb_institutions = [x.get_text() for x in period_result.find_all("ins_lang")]
-        except:
-            mdb_institutions = []
+        mdb_institutions = [x.get_text() for x in period_result.find_all("ins_lang")]
         for institution in institutions:
             if institution in mdb_institutions:
                 membership_dict["member_"+institution] = True
@@ -245,11 +215,8 @@ def parse_period(mdb, period, institutions = None):
             "List" : elec_list,
             }
     # Add Institution Membership if present
-    try:
-        for institution in membership_dict:
-            period_dict[institution] = membership_dict[institution]
-    except:
-        pass
+    for institution in membership_dict:
+        period_dict[institution] = membership_dict[institution]
     
     # Return Result
     return(period_dict)
@@ -270,8 +237,36 @@ def _reduce_to_period(mdbs, period):
     mdbs_filtered = list(itertools.compress(mdbs, period_boolean))
     return(mdbs_filtered)
     
+# Parse MdBs one after another
+def _iter_mdb_dicts(mdbs, period, institutions, report = None, strict = False):
+    # React to Presence of Period
+    if period is not None:
+        # Convert Number to String
+        period = str(period)
+        # Filter out Irrelevant MdBs
+        mdbs = _reduce_to_period(mdbs, period)
+    # Parse Single MdB
+    for mdb in mdbs:
+        try:
+            personal_dict = parse_personal(mdb, report = report, strict = strict)
+            if period is not None:
+                period_dict = parse_period(mdb = mdb,
+                                           period = period,
+                                           institutions = institutions,
+                                           report = report,
+                                           strict = strict)
+            else:
+                period_dict = {}
+            mdb_dict = {**personal_dict, **period_dict}
+            yield(mdb_dict)
+        except DataQualityError:
+            raise
+        except ValueError:
+            pass
+    
 # Parse all MdBs in File
-def collect_mdbs(mdbs, output = "dataframe", period = None, institutions = None):
+def collect_mdbs(mdbs, output = "dataframe", period = None, institutions = None,
+                 report = None, strict = False):
     """Collects all MdBs of MdB list into either 
        a dataframe, json, or list.
     
@@ -306,6 +301,16 @@ def collect_mdbs(mdbs, output = "dataframe", period = None, institutions = None)
         is correct. Can only be used if you have
         also specified a period.
         
+    report: list [optional]; default: None
+        A list to record data quality issues of the
+        MdBs in. Every issue is a dictionary with the
+        keys Record, Field, and Issue.
+        
+    strict: boolean; default: False
+        If True, the first data quality issue raises a
+        DataQualityError. Otherwise, issues are recorded
+        in report and parsing goes on.
+        
     Returns
     -----------
     result: DataFrame, str, or list
@@ -316,28 +321,9 @@ def collect_mdbs(mdbs, output = "dataframe", period = None, institutions = None)
         'list' will result in a Python list of
         dictionaries.
     """
-    # React to Presence of Period
-    if period is not None:
-        # Convert Number to String
-        period = str(period)
-        # Filter out Irrelevant MdBs
-        mdbs = _reduce_to_period(mdbs, period)
-    # Init List to collect Results
-    result_list = []
-    # Parse Single MdB and add to result_list
-    for mdb in mdbs:
-        try:
-            personal_dict = parse_personal(mdb)
-            if period is not None:
-                period_dict = parse_period(mdb = mdb,
-                                           period = period,
-                                           institutions = institutions)
-            else:
-                period_dict = {}
-            mdb_dict = {**personal_dict, **period_dict}
-            result_list.append(mdb_dict)
-        except ValueError:
-            pass
+    # Parse all MdBs into result_list
+    result_list = list(_iter_mdb_dicts(mdbs, period, institutions,
+                                       report = report, strict = strict))
     # Write Results to desired Output Format
     if output == "dataframe":
         result = pd.DataFrame(result_list)
@@ -348,4 +334,56 @@ def collect_mdbs(mdbs, output = "dataframe", period = None, institutions = None)
     else:
         raise ValueError("Output must either be 'dataframe', 'json', or 'list'.")
         
-    return(result)
\ No newline at end of file
+    return(result)
+
+
+# Iterate over MdBs in fixed-size Chunks
+def iter_mdb_frames(mdbs, chunk_size = 1000, period = None, institutions = None,
+                    report = None, strict = False):
+    """Yield MdBs as DataFrames of fixed size
+    
+    Works like collect_mdbs with output set to
+    'dataframe', but yields the MdBs as pandas
+    DataFrames of chunk_size rows each (the last
+    chunk may be smaller) instead of a single
+    DataFrame. MdBs are parsed only when the next
+    chunk is requested.
+    
+    Parameters
+    -----------
+    mdbs: BeautifulSoup
+        Output from read_mdbs function.
+        
+    chunk_size: int; default: 1000
+        The number of MdBs per DataFrame.
+        
+    period: int [optional]
+        If you want to collect data only for a
+        certain parliamentary period, you can 
+        specify this period as an integer.
+        
+    institutions: list of str [optional]
+        Dummy variables for membership in certain
+        institutions. See collect_mdbs.
+        
+    report: list [optional]; default: None
+        A list to record data quality issues in.
+        
+    strict: boolean; default: False
+        If True, data quality issues raise a
+        DataQualityError.
+        
+    Yields
+    -----------
+    chunk: pandas.DataFrame
+        At most chunk_size MdBs.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    mdb_dicts = _iter_mdb_dicts(mdbs, period, institutions,
+                                report = report, strict = strict)
+    while True:
+        chunk = list(itertools.islice(mdb_dicts, chunk_size))
+        if len(chunk) == 0:
+            break
+        yield(pd.DataFrame(chunk))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# Error for Strict Mode
+class DataQualityError(ValueError):
+    """Raised in strict mode if a record has a data quality issue"""
+    pass
+
+
+# Index Descendants of Element by Tag
+def index_tags(element):
+    """Index all descendants of an element by tag name
+
+    Walks the element once and keeps the first
+    descendant of every tag name. Looking up many
+    fields in the index is much faster than searching
+    the element once per field, especially if most
+    fields are absent and every search would have to
+    scan the entire element.
+
+    Parameters
+    -----------
+    element : BeautifulSoup
+        The element to index.
+
+    Returns
+    -----------
+    index : Dict
+        The first descendant for every tag name. Can
+        be used in place of the element in get_text.
+    """
+    index = dict()
+    for child in element.find_all(True):
+        if child.name not in index:
+            index[child.name] = child
+    return(index)
+
+# Get Text of Child Element
+def get_text(element, tag, empty_as_none = False):
+    """Get the text of a child element without raising
+
+    Parameters
+    -----------
+    element : BeautifulSoup or Dict
+        The element to search in or its index as
+        returned by index_tags. May be None.
+
+    tag : string
+        The name of the child element.
+
+    empty_as_none : boolean; default: False
+        Whether or not an empty text should be
+        returned as None.
+
+    Returns
+    -----------
+    text : str
+        The text of the first child element with the
+        given name or None if there is no such element.
+    """
+    if element is None:
+        return(None)
+    if isinstance(element, dict):
+        child = element.get(tag)
+    else:
+        child = element.find(tag)
+    if child is None:
+        return(None)
+    text = child.get_text()
+    if empty_as_none and (text == ""):
+        return(None)
+    return(text)
+
+# Get Attribute of Element
+def get_attribute(element, attribute):
+    """Get an attribute of an element without raising
+
+    Parameters
+    -----------
+    element : BeautifulSoup
+        The element. May be None.
+
+    attribute : string
+        The name of the attribute.
+
+    Returns
+    -----------
+    value : str
+        The value of the attribute or None if the
+        element or the attribute is missing.
+    """
+    if element is None:
+        return(None)
+    return(element.get(attribute))
+
+# Record Data Quality Issue
+def report_issue(report, strict, record, field, issue):
+    """Records a data quality issue of a single record
+
+    In lenient mode, the issue is appended to the report
+    (if one was given) and parsing goes on. In strict
+    mode, a DataQualityError is raised instead.
+
+    Parameters
+    -----------
+    report : list [optional]
+        The list to append the issue to. Nothing is
+        recorded if None.
+
+    strict : boolean
+        Whether or not to raise a DataQualityError.
+
+    record : str
+        The ID of the affected speech or MdB. None if
+        the issue concerns the entire protocol.
+
+    field : str
+        The affected field (e.g. 'Speaker').
+
+    issue : str
+        The kind of issue: 'missing', 'empty', or
+        'unknown'.
+    """
+    if strict:
+        raise DataQualityError("{} of record {} is {}".format(field, record, issue))
+    if report is not None:
+        report.append({"Record" : record,
+                       "Field" : field,
+                       "Issue" : issue})
@@ -3,6 +3,8 @@
 
 # Import Modules
 from bs4 import BeautifulSoup
+from pybundestag.parser.textnormalizer import normalize_speeches, PARAGRAPH_SEPERATOR
+from pybundestag.parser.quality import index_tags, get_text, get_attribute, report_issue
 import pandas as pd
 import json
 
@@ -37,7 +39,7 @@ def read_protocol(path):
 
 
 # Get Overall Information
-def parse_metadata(protocol):
+def parse_metadata(protocol, report = None, strict = False):
     """Parse meta data from protocol
     
     If you would like to parse meta data from a given
@@ -54,6 +56,12 @@ def parse_metadata(protocol):
         to parse the protcol by using read_protocol
         first. The output of that function should be
         the input to this function.
+    report: list [optional]; default: None
+        A list to record missing meta data in (see
+        quality.report_issue).
+    strict: boolean; default: False
+        If True, missing meta data raises a
+        DataQualityError.
     
     Returns
     -----------
@@ -63,25 +71,19 @@ def parse_metadata(protocol):
         None if no information was found.
     """
     # Parse Parliamentary Period
-    try:
-        period = protocol.find("wahlperiode").get_text()
-    except Exception:
-        period = None
+    period = get_text(protocol, "wahlperiode", empty_as_none = True)
+    if period is None:
+        report_issue(report, strict, None, "Period", "unknown")
     # Parse Parliamentary Session
-    try:
-        session = protocol.find("sitzungsnr").get_text()
-    except Exception:
-        session = None
+    session = get_text(protocol, "sitzungsnr", empty_as_none = True)
+    if session is None:
+        report_issue(report, strict, None, "Session", "missing")
     # Parse Location of Speech
-    try:
-        location = protocol.find("ort").get_text()
-    except:
-        location = None
+    location = get_text(protocol, "ort")
     # Parse Date of Speech
-    try:
-        date = protocol.find("datum")["date"]
-    except Exception:
-        date = None
+    date = get_attribute(protocol.find("datum"), "date")
+    if date is None:
+        report_issue(report, strict, None, "Date", "missing")
     # Collect Information to Dictionary
     meta_dict = {"location" : location,
                  "date" : date,
@@ -91,7 +93,7 @@ def parse_metadata(protocol):
     return(meta_dict)
 
 # Parse Single Speech
-def parse_speech(speech):
+def parse_speech(speech, report = None, strict = False, paragraphs = None):
     """Split information on speaker and text from speech
     
     This function will yield the first name, last name,
@@ -105,6 +107,17 @@ def parse_speech(speech):
     speech: BeautifulSoup
         Use a single speech extracted from the entire
         protocol converted by read_protocol.
+    report: list [optional]; default: None
+        A list to record data quality issues in (missing
+        speaker or speech ID, empty text). See
+        quality.report_issue.
+    strict: boolean; default: False
+        If True, data quality issues raise a
+        DataQualityError instead of being recorded.
+    paragraphs: list [optional]; default: None
+        A list to append the paragraphs of the speech
+        to (as a list of str). In Text, paragraphs are
+        seperated by line breaks.
         
     Returns
     -----------
@@ -115,61 +128,46 @@ def parse_speech(speech):
         the party affiliation of the speaker. Text is the
         raw speech stripped of all comments.
     """
+    # Parse ID of Speech
+    id_speech = get_attribute(speech, "id")
+    if id_speech is None:
+        report_issue(report, strict, None, "SpeechID", "missing")
     # Parse Information Regarding Speaker
-    try:
-        speaker = speech.find("redner")
+    speaker = speech.find("redner")
+    if speaker is not None:
         # Parse Speaker ID
-        try:
-            id_speaker = speaker["id"]
-        except Exception:
-            id_speaker = None
+        id_speaker = get_attribute(speaker, "id")
+        if id_speaker is None:
+            report_issue(report, strict, id_speech, "SpeakerID", "missing")
+        # Index Fields once instead of searching Speaker for every Field
+        fields = index_tags(speaker)
         # Parse First Name
-        try:
-            firstname = speaker.find("vorname").get_text()
-        except Exception:
-            firstname = ""
+        firstname = get_text(fields, "vorname") or ""
         # Parse Last Name
-        try:
-            lastname = speaker.find("nachname").get_text()
-        except Exception:
-            lastname = ""
-        # Parse Party Affiliation
-        try:
-            party = speaker.find("fraktion").get_text()
-        except Exception:
-            party = None
-        # Parse Role of Speaker
-        try:
-            role = speaker.find("rolle").get_text()
-        except Exception:
-            role = None
-        # Collect Results to Dictionary
+        lastname = get_text(fields, "nachname") or ""
+        # Collect Results to Dictionary (Party and Role are optional)
         speaker_dict = {"id_speaker" : id_speaker,
                         "firstname" : firstname,
                         "lastname" : lastname,
                         "name" : firstname + " " + lastname,
-                        "party" : party,
-                        "role" : role}
+                        "party" : get_text(fields, "fraktion"),
+                        "role" : get_text(fields, "rolle")}
     # Create Missing Values if no Speaker is associated to Speech
-    except Exception:
+    else:
+        report_issue(report, strict, id_speech, "Speaker", "missing")
         speaker_dict = {"id_speaker" : None,
                         "firstname" : None,
                         "lastname" : None,
                         "name" : None,
                         "party" : None,
                         "role" : None}
-    # Parse Speech
-        # Parse ID of Speech
-    try:
-        id_speech = speech["id"]
-    except Exception:
-        id_speech = None
-        # Parse Text of Speech
-    try:
-        text = speech.find_all("p", {"klasse" : ["J", "J_1", "O"]})
-        text = "\n".join([x.get_text() for x in text])
-    except Exception:
-        text = None
+    # Parse Text of Speech
+    text = [x.get_text() for x in speech.find_all("p", {"klasse" : ["J", "J_1", "O"]})]
+    if paragraphs is not None:
+        paragraphs.append(text)
+    text = PARAGRAPH_SEPERATOR.join(text)
+    if text.strip() == "":
+        report_issue(report, strict, id_speech, "Text", "empty")
 
     
     # Join Information on Name, Party, Role, and Text into single
@@ -184,7 +182,8 @@ def parse_speech(speech):
     
     
 # Parse all Speeches in a Protocol
-def collect_speeches(protocol, output = "dataframe", metadata = False):
+def collect_speeches(protocol, output = "dataframe", metadata = False, normalize = False,
+                     report = None, strict = False):
     """Collect all speeches into either a DataFrame, 
        json, or list
     
@@ -208,6 +207,20 @@ def collect_speeches(protocol, output = "dataframe", metadata = False):
     metadata: boolean; default: False
         Whether or not to include any meta data
         for the speeches in the result.
+    normalize: boolean; default: False
+        Whether or not to normalize the text of the
+        speeches (see textnormalizer.normalize_texts).
+        If True, the result will also contain the
+        number of tokens and sentences per speech.
+    report: list [optional]; default: None
+        A list to record data quality issues of the
+        protocol and its speeches in. Every issue is a
+        dictionary with the keys Record, Field, and
+        Issue.
+    strict: boolean; default: False
+        If True, the first data quality issue raises a
+        DataQualityError. Otherwise, issues are recorded
+        in report and parsing goes on.
         
     Returns
     -----------
@@ -215,17 +228,31 @@ def collect_speeches(protocol, output = "dataframe", metadata = False):
         All speeches in a highly structured format.
         Will contain raw text and additional information
         on speaker and context.
+        
+    Raises
+    -----------
+    ValueError
+        If the protocol contains neither speeches nor
+        meta data, e.g. because the file is malformed.
     """
     result_list = []
-    meta = parse_metadata(protocol)
-    for speech in protocol.find_all("rede"):
-        result = parse_speech(speech)
+    meta = parse_metadata(protocol, report = report, strict = strict)
+    speeches = protocol.find_all("rede")
+    # The lenient Parser accepts any Input, so detect Files that are no Protocol
+    if (len(speeches) == 0) and (meta["period"] is None) and (meta["session"] is None):
+        raise ValueError("Input contains neither speeches nor meta data. Is it a Bundestag protocol?")
+    # Paragraphs are needed to normalize Line Breaks within Paragraphs
+    paragraphs = [] if normalize else None
+    for speech in speeches:
+        result = parse_speech(speech, report = report, strict = strict, paragraphs = paragraphs)
         if metadata:
             result["Location"] = meta["location"]
             result["Date"] = meta["date"]
             result["Period"] = meta["period"]
             result["Session"] = meta["session"]
         result_list.append(result)
+    if normalize:
+        result_list = normalize_speeches(result_list, paragraphs = paragraphs)
     if output == "dataframe":
         result = pd.DataFrame(result_list)
     elif output == "json":
@@ -234,4 +261,61 @@ def collect_speeches(protocol, output = "dataframe", metadata = False):
         result = result_list
     else:
         raise ValueError("Output must either be 'dataframe', 'json', or 'list'.")
-    return(result)
\ No newline at end of file
+    return(result)
+
+
+# Iterate over Speeches of many Protocols in fixed-size Chunks
+def iter_speech_frames(paths, chunk_size = 1000, metadata = False, normalize = False,
+                       report = None, strict = False):
+    """Yield speeches of many protocols as DataFrames
+       of fixed size
+    
+    Reads the protocols one after another and yields
+    their speeches as pandas DataFrames of chunk_size
+    rows each (the last chunk may be smaller). Chunks
+    may span several protocols. Only the current
+    protocol and one chunk are kept in memory, so
+    archives of any size can be processed without
+    concatenating DataFrames.
+    
+    Parameters
+    -----------
+    paths: iterable of str
+        The paths to the protocols. Each must be a
+        valid XML file.
+    chunk_size: int; default: 1000
+        The number of speeches per DataFrame.
+    metadata: boolean; default: False
+        Whether or not to include any meta data
+        for the speeches in the result.
+    normalize: boolean; default: False
+        Whether or not to normalize the text of the
+        speeches.
+    report: list [optional]; default: None
+        A list to record data quality issues in.
+    strict: boolean; default: False
+        If True, data quality issues raise a
+        DataQualityError.
+        
+    Yields
+    -----------
+    chunk: pandas.DataFrame
+        At most chunk_size speeches.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    buffer = []
+    for path in paths:
+        protocol = read_protocol(path)
+        buffer.extend(collect_speeches(protocol, output = "list",
+                                       metadata = metadata,
+                                       normalize = normalize,
+                                       report = report,
+                                       strict = strict))
+        start = 0
+        while len(buffer) - start >= chunk_size:
+            yield(pd.DataFrame(buffer[start:start + chunk_size]))
+            start += chunk_size
+        buffer = buffer[start:]
+    if len(buffer) > 0:
+        yield(pd.DataFrame(buffer))
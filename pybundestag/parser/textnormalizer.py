@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Import Modules
+import re
+import itertools
+import unicodedata
+
+
+# Seperator between Texts of a Batch (not allowed in XML)
+BATCH_SEPERATOR = "\x00"
+
+# Seperator between Paragraphs of a Speech (see parse_speech)
+PARAGRAPH_SEPERATOR = "\n"
+
+# Abbreviations not ending a Sentence
+ABBREVIATIONS = ["Dr", "Prof", "Nr", "Abs", "Art", "bzw", "vgl", "ca",
+                 "Mio", "Mrd", "St", "Abg", "Kap", "Ziff"]
+
+# Words following a suspended Hyphen ('Bundes- und Landesprojekte')
+SUSPENDED_WORDS = ["und", "oder", "bis", "sowie", "noch"]
+
+# Words following an Ordinal ('19. Wahlperiode', '3. Oktober')
+ORDINAL_WORDS = ["Januar", "Februar", "März", "April", "Mai", "Juni", "Juli",
+                 "August", "September", "Oktober", "November", "Dezember",
+                 "Wahlperiode", "Legislaturperiode", "Sitzung", "Sitzungswoche",
+                 "Lesung", "Jahrhundert", "Mal", "Deutschen", "Bundestag"]
+
+# Precompiled Patterns
+SUSPENDED = "(?!(?:{})\\b)".format("|".join(SUSPENDED_WORDS))
+SOFT_HYPHEN_PATTERN = re.compile("\u00ad")
+HYPHENATION_PATTERN = re.compile(r"(\w)-\s*\n\s*" + SUSPENDED + r"(?=[a-zäöüß])")
+COMPOUND_PATTERN = re.compile(r"(\w-)\s*\n\s*" + SUSPENDED + r"(?=\w)")
+SPACE_PATTERN = re.compile(r"\s+")
+TOKEN_PATTERN = re.compile(r"\w+(?:[-'’.]\w+)*")
+# Abbreviations made of single Characters ('z. B.', 'd.h.') and Ordinals
+# followed by a Month or a known Noun ('19. Wahlperiode') do not end a Sentence
+ORDINAL = r"\s+(?:{})\b".format("|".join(ORDINAL_WORDS))
+SENTENCE_PATTERN = re.compile("".join(["(?<!\\b{}\\.)".format(x) for x in ABBREVIATIONS]) +
+                              r"(?<!\b\w\. \w\.)(?<!\b\w\.\w\.)" +
+                              r"(?<=[.!?…])(?!(?<=\b\w\.) ?\w\.)" +
+                              "".join(["(?!(?<=\\b{}\\.){})".format(x, ORDINAL)
+                                       for x in [r"\d", r"\d\d", r"\d\d\d"]]) +
+                              r"\s+(?=\S)|\n+")
+
+
+# Normalize a single Batch of Paragraphs
+def _normalize_batch(paragraphs):
+    batch = BATCH_SEPERATOR.join(paragraphs)
+    batch = unicodedata.normalize("NFC", batch)
+    batch = SOFT_HYPHEN_PATTERN.sub("", batch)
+    batch = HYPHENATION_PATTERN.sub(r"\1", batch)
+    batch = COMPOUND_PATTERN.sub(r"\1", batch)
+    batch = SPACE_PATTERN.sub(" ", batch)
+    paragraphs = [x.strip() for x in batch.split(BATCH_SEPERATOR)]
+    return(paragraphs)
+
+# Split Text into Paragraphs
+def _get_paragraphs(text):
+    if isinstance(text, str):
+        return(text.split(PARAGRAPH_SEPERATOR))
+    return(list(text))
+
+
+# Normalize Texts
+def normalize_texts(texts, batch_size = 1000):
+    """Normalizes the text of speeches
+
+    Cleans up raw speech texts as returned by
+    parse_speech. Texts are normalized to Unicode NFC,
+    soft hyphens are removed, words hyphenated across
+    line breaks are joined (compounds such as
+    'CDU/CSU-Antrag' keep their hyphen, suspended
+    hyphens as in 'Bundes- und Landesprojekte' are
+    kept as well), and runs of whitespace are collapsed
+    into a single space. Paragraphs are kept on
+    seperate lines and words are never joined across
+    paragraphs.
+
+    Texts are processed in batches. Every batch is
+    joined into a single string, so each pattern is
+    applied once per batch instead of once per text.
+
+    Parameters
+    -----------
+    texts : iterable of str or list of str
+        The texts to normalize. None values are kept.
+        A text is either a string with one paragraph per
+        line (as returned by parse_speech) or a list of
+        paragraphs. Only in the latter case, line breaks
+        within a paragraph can be told apart from the
+        end of a paragraph.
+
+    batch_size : int; default: 1000
+        The number of texts processed at once.
+
+    Returns
+    -----------
+    result : list of str
+        The normalized texts in the order of the input.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    texts = iter(texts)
+    result = []
+    while True:
+        batch = list(itertools.islice(texts, batch_size))
+        if len(batch) == 0:
+            break
+        paragraphs = [_get_paragraphs(x) for x in batch if x is not None]
+        normalized = iter(_normalize_batch(itertools.chain.from_iterable(paragraphs)))
+        # Join Paragraphs of every Text again, skipping empty Paragraphs
+        paragraphs = iter([[y for y in itertools.islice(normalized, len(x)) if y != ""]
+                           for x in paragraphs])
+        result.extend([None if x is None else PARAGRAPH_SEPERATOR.join(next(paragraphs))
+                       for x in batch])
+    return(result)
+
+# Split Text into Sentences
+def split_sentences(text):
+    """Splits a text into sentences
+
+    A sentence ends with '.', '!', '?' or '…' followed
+    by whitespace, or at the end of a paragraph. Common
+    abbreviations (e.g. 'Dr.' or 'z. B.') and ordinals
+    (e.g. '19. Wahlperiode') do not end a sentence.
+
+    Parameters
+    -----------
+    text : str
+        A (normalized) text.
+
+    Returns
+    -----------
+    sentences : list of str
+        The sentences of the text.
+    """
+    if text is None:
+        return([])
+    sentences = [x.strip() for x in SENTENCE_PATTERN.split(text)]
+    sentences = [x for x in sentences if x != ""]
+    return(sentences)
+
+# Count Tokens of Text
+def count_tokens(text):
+    """Counts the word tokens of a text
+
+    Parameters
+    -----------
+    text : str
+        A (normalized) text.
+
+    Returns
+    -----------
+    count : int
+        The number of word tokens. Punctuation is
+        not counted.
+    """
+    if text is None:
+        return(0)
+    return(len(TOKEN_PATTERN.findall(text)))
+
+# Normalize Speeches
+def normalize_speeches(speeches, batch_size = 1000, paragraphs = None):
+    """Normalizes the text of parsed speeches
+
+    Replaces the Text of every speech by its normalized
+    version (see normalize_texts) and adds the keys
+    TokenCount and SentenceCount. The speeches are
+    changed in place.
+
+    Parameters
+    -----------
+    speeches : list of dict
+        Speeches as returned by parse_speech.
+
+    batch_size : int; default: 1000
+        The number of texts normalized at once.
+
+    paragraphs : list of list of str [optional]; default: None
+        The paragraphs of every speech in the order of
+        speeches. If None, every line of the Text is
+        treated as a paragraph.
+
+    Returns
+    -----------
+    speeches : list of dict
+        The input speeches with normalized text.
+    """
+    if paragraphs is None:
+        paragraphs = [x["Text"] for x in speeches]
+    texts = normalize_texts(paragraphs, batch_size = batch_size)
+    for speech, text in zip(speeches, texts):
+        speech["Text"] = text
+        speech["TokenCount"] = count_tokens(text)
+        speech["SentenceCount"] = len(split_sentences(text))
+    return(speeches)
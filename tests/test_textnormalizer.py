@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Import Modules
+from pybundestag.parser.textnormalizer import split_sentences, normalize_texts
+
+
+# Multi-part Abbreviations do not end a Sentence
+def test_split_sentences_spaced_abbreviations():
+    text = "Das gilt z. B. für alle. Das heißt d. h. nichts. Es kamen u. a. Gäste."
+    assert split_sentences(text) == ["Das gilt z. B. für alle.",
+                                     "Das heißt d. h. nichts.",
+                                     "Es kamen u. a. Gäste."]
+
+# Unspaced Abbreviations do not end a Sentence
+def test_split_sentences_unspaced_abbreviations():
+    assert split_sentences("Das gilt z.B. heute. Herr Dr. Müller spricht.") == \
+        ["Das gilt z.B. heute.", "Herr Dr. Müller spricht."]
+
+# Ordinals do not end a Sentence
+def test_split_sentences_ordinals():
+    text = "Das gilt für die 19. Wahlperiode. Am 3. Oktober tagen wir."
+    assert split_sentences(text) == ["Das gilt für die 19. Wahlperiode.",
+                                     "Am 3. Oktober tagen wir."]
+
+# Years still end a Sentence
+def test_split_sentences_years():
+    assert split_sentences("Das war 2019. Jetzt ist es anders.") == \
+        ["Das war 2019.", "Jetzt ist es anders."]
+
+# Paragraphs and Punctuation end a Sentence
+def test_split_sentences_paragraphs():
+    assert split_sentences("Frage? Antwort!\nNeuer Absatz") == \
+        ["Frage?", "Antwort!", "Neuer Absatz"]
+
+# Numbers and single Characters at the End still end a Sentence
+def test_split_sentences_numbers_and_characters():
+    text = "Das regelt Artikel 3. Wir stimmen zu. Das kostet 100. Mehr nicht. Wir brauchen Plan B. Danke."
+    assert split_sentences(text) == ["Das regelt Artikel 3.", "Wir stimmen zu.",
+                                     "Das kostet 100.", "Mehr nicht.",
+                                     "Wir brauchen Plan B.", "Danke."]
+
+# Abbreviations and Ordinals within one Sentence
+def test_split_sentences_abbreviations_and_ordinals():
+    text = "Das gilt z. B. für die 19. Wahlperiode. Das heißt d. h. nichts."
+    assert split_sentences(text) == ["Das gilt z. B. für die 19. Wahlperiode.",
+                                     "Das heißt d. h. nichts."]
+
+# Hyphenation and Whitespace are normalized per Paragraph of a Batch
+def test_normalize_texts():
+    texts = [["Kolle-\ngen,  das  ist\u00ad gut."], None, ["CDU/CSU-\nAntrag"]]
+    assert normalize_texts(texts, batch_size = 2) == ["Kollegen, das ist gut.", None, "CDU/CSU-Antrag"]
+
+# Suspended Hyphens are kept
+def test_normalize_texts_suspended_hyphens():
+    texts = [["Wir fördern Bundes-\nund Landesprojekte."], ["Ein-\n oder Ausgang"]]
+    assert normalize_texts(texts) == ["Wir fördern Bundes- und Landesprojekte.", "Ein- oder Ausgang"]
+
+# Words are not joined across Paragraphs
+def test_normalize_texts_paragraphs():
+    assert normalize_texts(["Wir fördern Bundes-\nländer sind zuständig.", ["Wir fördern-", "", " gut "]]) == \
+        ["Wir fördern Bundes-\nländer sind zuständig.", "Wir fördern-\ngut"]